@@ -1,12 +1,23 @@
 import argparse
 import config
-import json
+import ijson
 from pathlib import Path
 from typing import List, Optional
 from scraper.scraper import WebScraper
+from scraper.http_scraper import HttpScraper
+from scraper.aio_scraper import AioScraper
 from scraper.file_storage import FileStorageManager
 
 
+# Python type names for the ijson events that start a non-list, non-number JSON value
+_JSON_TYPE_NAMES = {
+    "start_map": "dict",
+    "string": "str",
+    "boolean": "bool",
+    "null": "NoneType",
+}
+
+
 def load_ids_from_file(file_path: str, access_key: Optional[str] = None) -> List[str]:
     """
     Loads a list of unique IDs from a file.
@@ -34,34 +45,68 @@ def load_ids_from_file(file_path: str, access_key: Optional[str] = None) -> List
                 "Provide it using --access-key argument."
             )
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        keys = access_key.split(".")
+        path_prefixes = [".".join(keys[: i + 1]) for i in range(len(keys))]
+
+        # First parse event seen at each step of the access key path, i.e. the
+        # type of the value found there
+        found = {}
+
+        def record_path(events):
+            for prefix, event, value in events:
+                if prefix in path_prefixes:
+                    found.setdefault(prefix, (event, value))
+                yield prefix, event, value
+
+        # Stream the list members so the whole document is never materialized
+        with open(file_path, "rb") as f:
+            ids = [
+                str(item)
+                for item in ijson.items(record_path(ijson.parse(f)), f"{access_key}.item")
+            ]
 
         # Navigate through the JSON using the access key path
-        keys = access_key.split(".")
-        current = data
-        for key in keys:
-            if not isinstance(current, dict) or key not in current:
+        for key, prefix in zip(keys, path_prefixes):
+            if prefix not in found:
                 raise ValueError(
                     f"Access key path '{access_key}' not found in JSON file. "
                     f"Failed at key '{key}'."
                 )
-            current = current[key]
 
         # Ensure we have a list
-        if not isinstance(current, list):
+        event, value = found[access_key]
+        if event != "start_array":
+            # ijson yields Decimal for non-integral numbers, where json.load gives float
+            type_name = _JSON_TYPE_NAMES.get(event) or (
+                "int" if isinstance(value, int) else "float"
+            )
             raise ValueError(
                 f"Access key path '{access_key}' does not point to a list. "
-                f"Found type: {type(current).__name__}"
+                f"Found type: {type_name}"
             )
 
-        # Convert all items to strings
-        return [str(item) for item in current]
+        return ids
 
     else:
         # Treat as text file (one ID per line)
         with open(file_path, "r") as f:
-            return [line.strip() for line in f if line.strip()]
+            return list(filter(None, map(str.strip, f)))
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for options that must be a whole number of at least 0."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
 
 
 def main() -> None:
@@ -85,18 +130,58 @@ def main() -> None:
     )
     arg_parser.add_argument(
         "--limit",
-        type=int,
+        type=non_negative_int,
         help="Optional limit on number of items to scrape. Stops after this many successful scrapes.",
     )
+    arg_parser.add_argument(
+        "--backend",
+        choices=["selenium", "http", "async"],
+        default="async",
+        help="How pages are fetched: concurrent aiohttp requests (async), plain HTTP requests "
+        "(http), both parsed with lxml, or a headless Chrome (selenium) as a fallback for "
+        "pages that need JavaScript. Defaults to async.",
+    )
+    arg_parser.add_argument(
+        "--cache-pages",
+        action="store_true",
+        help="With the http/async backends, keep fetched HTML under the data directory "
+        "and reuse it on later runs instead of refetching.",
+    )
+    arg_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write scraped JSON indented for readability instead of compact.",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="Number of pages to scrape concurrently: Chrome instances or HTTP requests in flight (default: 1).",
+    )
 
     args = arg_parser.parse_args()
 
-    storage = FileStorageManager(data_dir=f"{config.DATA_DIR}/{args.parser}")
-    scraper = WebScraper(storage_manager=storage, parser=args.parser)
+    storage = FileStorageManager(
+        data_dir=f"{config.DATA_DIR}/{args.parser}", pretty=args.pretty
+    )
+    scraper_class = {
+        "selenium": WebScraper,
+        "http": HttpScraper,
+        "async": AioScraper,
+    }[args.backend]
+    scraper_kwargs = {"cache_pages": args.cache_pages} if args.backend != "selenium" else {}
+    scraper = scraper_class(
+        storage_manager=storage,
+        parser=args.parser,
+        workers=args.workers,
+        **scraper_kwargs,
+    )
 
     try:
         item_ids = load_ids_from_file(args.ids, access_key=args.access_key)
-        scraper.scrape_multiple(item_ids, limit=args.limit)
+        _, stop_reason = scraper.scrape_multiple(item_ids, limit=args.limit)
+        if stop_reason is not None:
+            print(stop_reason)
 
     except KeyboardInterrupt:
         print("\nScraping interrupted by user. Progress has been saved.")
@@ -104,6 +189,7 @@ def main() -> None:
         print(f"Error during scraping: {e}")
     finally:
         scraper.close()
+        storage.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+import asyncio
+import random
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Iterator
+import aiohttp
+from scraper.base_scraper import BaseScraper
+from scraper.http_scraper import HttpMixin, decode_body
+
+
+class AioScraper(HttpMixin, BaseScraper):
+    """An HTTP scraper that fetches many static pages concurrently with aiohttp."""
+
+    # Upper bound, in seconds, of the random pause after each fetch to stay polite
+    JITTER = 0.5
+
+    def _start_workers(self) -> None:
+        """No worker pool: pages are fetched with one aiohttp session per run, see _scrape_session."""
+
+    def scrape_page(self, item_id: str) -> dict | None:
+        """Scrapes a single page through aiohttp, exactly like one page of a run."""
+        with self._scrape_session() as submit:
+            return self._record_page(item_id, submit(item_id).result)
+
+    @contextmanager
+    def _scrape_session(self) -> Iterator[Callable[[str], Future]]:
+        """
+        Runs an event loop on a helper thread and yields a function that schedules loading
+        one page on it, returning a Future of its data, with at most `workers` requests in
+        flight. The loop keeps fetching while the caller of iter_scrape saves results.
+        """
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+
+        def run(coro) -> Future:
+            return asyncio.run_coroutine_threadsafe(coro, loop)
+
+        try:
+            session, semaphore = run(self._open_session()).result()
+            parser = self.parser_class()
+            try:
+                yield lambda item_id: run(
+                    self._fetch_page_async(session, semaphore, parser, item_id)
+                )
+            finally:
+                run(self._close_session(session)).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def _open_session(self) -> tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.workers),
+            headers={"User-Agent": self.USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+        )
+        return session, asyncio.Semaphore(self.workers)
+
+    async def _close_session(self, session: aiohttp.ClientSession) -> None:
+        """Cancels pages still queued or in flight, e.g. after an early stop, then closes the session."""
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await session.close()
+
+        # Let page cache reads and writes started with to_thread finish
+        await asyncio.get_running_loop().shutdown_default_executor()
+
+    async def _fetch_page_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        parser,
+        item_id: str,
+    ) -> dict:
+        """Async counterpart of _fetch_page for a single ID."""
+        url = f"{self.url_prefix}{item_id}"
+
+        # Cached pages count against `workers` too, and their gzip file I/O runs off the
+        # event loop so it does not stall the requests in flight
+        async with semaphore:
+            html = None
+            if self.cache_pages:
+                html = await asyncio.to_thread(self.storage.load_page, item_id)
+
+            if html is None:
+                print(f"Scraping {url}")
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    html = decode_body(await response.read(), response.charset)
+                if self.cache_pages:
+                    await asyncio.to_thread(self.storage.save_page, item_id, html)
+                await asyncio.sleep(random.uniform(0, self.JITTER))
+            else:
+                print(f"Scraping {url} (cached)")
+
+        return parser.parse_html(html)
@@ -0,0 +1,341 @@
+import config
+import functools
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Generator, Iterator
+from scraper.parsers import JeopardyGameParser, JeopardySeasonListParser
+
+
+class BaseScraper:
+    """Shared scraping loop: fetches pages by ID, parses them and stores them using FileStorageManager."""
+
+    SUPPORTED_PARSERS = {
+        "jeopardy_game": JeopardyGameParser,
+        "jeopardy_season_list": JeopardySeasonListParser,
+    }
+
+    def __init__(
+        self,
+        storage_manager,
+        parser: str,
+        url_prefix: str = config.URL_PREFIX,
+        workers: int = 1,
+    ) -> None:
+        """
+        Initializes the scraper with a storage manager, parser type, and URL prefix.
+
+        Args:
+            storage_manager: The storage manager responsible for saving and loading data.
+            parser (str): The name of the parser to use.
+            url_prefix (str): The common URL prefix to reconstruct full URLs from IDs.
+            workers (int): Number of pages scraped concurrently.
+        """
+        if parser not in self.SUPPORTED_PARSERS:
+            raise ValueError(
+                f"Unsupported parser '{parser}'. Supported values: {list(self.SUPPORTED_PARSERS.keys())}"
+            )
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        self.storage = storage_manager
+        self.url_prefix = url_prefix
+        self.workers = workers
+        self.parser_name = parser
+        self.parser_class = self.SUPPORTED_PARSERS[parser]
+
+        # Saves run on a background thread so the next page load is not held up by disk I/O;
+        # each save's Future is kept until it succeeds or its outcome is collected
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_saves: dict[str, Future] = {}
+        self._saves_lock = threading.Lock()
+
+        # Pool of workers (e.g. a WebDriver and its parser); each page borrows one for its duration
+        self._workers = []
+        self._pool: queue.Queue = queue.Queue()
+        try:
+            self._start_workers()
+        except Exception:
+            self.close()
+            raise
+
+    def _start_workers(self) -> None:
+        """Fills the pool with one worker per concurrent page."""
+        for index in range(self.workers):
+            worker = self._create_worker(index)
+            self._workers.append(worker)
+            self._pool.put(worker)
+
+    def _create_worker(self, index: int):
+        """Creates the index-th pooled worker."""
+        raise NotImplementedError
+
+    def _close_worker(self, worker) -> None:
+        """Releases the resources held by a pooled worker."""
+
+    @contextmanager
+    def _borrow_worker(self):
+        """Takes a worker from the pool for the duration of a with-block."""
+        worker = self._pool.get()
+        try:
+            yield worker
+        finally:
+            self._pool.put(worker)
+
+    def _load_and_parse(self, item_id: str, url: str) -> dict:
+        """Fetches a page and extracts its data."""
+        raise NotImplementedError
+
+    def scrape_page(self, item_id: str) -> dict | None:
+        """
+        Scrapes a webpage based on its unique ID.
+
+        Args:
+            item_id (str): The unique identifier for the page.
+
+        Returns:
+            dict | None: Extracted data if successful, otherwise None.
+        """
+        return self._record_page(item_id, functools.partial(self._fetch_page, item_id))
+
+    def _fetch_page(self, item_id: str) -> dict:
+        """Loads and parses one page without saving it; raises if it cannot be scraped."""
+        url = f"{self.url_prefix}{item_id}"
+        print(f"Scraping {url}")
+        return self._load_and_parse(item_id, url)
+
+    def _record_page(self, item_id: str, load: Callable[[], dict]) -> dict | None:
+        """Saves the page data returned by load(), or error metadata if it raised."""
+        url = f"{self.url_prefix}{item_id}"
+
+        try:
+            data = load()
+        except Exception as e:
+            self._save_failure(item_id, url, e)
+            return None
+
+        return self._save_page(item_id, url, data)
+
+    def _save_page(self, item_id: str, url: str, data: dict) -> dict:
+        """Adds scrape metadata to parsed page data and saves it."""
+        metadata = data.setdefault("_metadata", {})
+        metadata["id"] = item_id
+        metadata["url"] = url
+        metadata["timestamp"] = datetime.now().isoformat()
+
+        future = self._io_pool.submit(self._store_page, item_id, data)
+        with self._saves_lock:
+            # Forget saves that already succeeded; failed ones stay until reported
+            self._pending_saves = {
+                i: f for i, f in self._pending_saves.items() if not f.done() or f.exception()
+            }
+            self._pending_saves[item_id] = future
+
+        return data
+
+    def _store_page(self, item_id: str, data: dict) -> None:
+        """Saves scraped page data on the I/O thread, then reports how the page went."""
+        # Save the data (even if it has errors - partial data is better than nothing)
+        self.storage.save_data(item_id, data)
+
+        # Check if there were any errors
+        errors = data["_metadata"].get("errors", [])
+        if errors:
+            print(f"Scraped {item_id} with {len(errors)} error(s) - check metadata")
+        else:
+            print(f"Successfully scraped {item_id}")
+
+    def _save_failure(self, item_id: str, url: str, error: Exception) -> None:
+        """Saves error metadata for a page that could not be scraped at all."""
+        error_message = f"Fatal error during scraping: {str(error)}"
+        print(f"Error scraping {item_id}: {error_message}")
+
+        # Create minimal data structure with error metadata
+        error_data = {
+            "_metadata": {
+                "errors": [error_message],
+                "id": item_id,
+                "url": url,
+                "timestamp": datetime.now().isoformat(),
+                "scrape_failed": True,
+            }
+        }
+
+        # Try to save the error data
+        try:
+            self.storage.save_data(item_id, error_data)
+            print(f"Saved error metadata for {item_id}")
+        except Exception as save_error:
+            print(f"Failed to save error metadata for {item_id}: {save_error}")
+
+    def _wait_for_save(self, item_id: str) -> BaseException | None:
+        """Waits for the background save of one page and returns its error, if any."""
+        with self._saves_lock:
+            future = self._pending_saves.pop(item_id, None)
+        return None if future is None else future.exception()
+
+    def _drain_saves(self) -> None:
+        """Waits for all background saves to finish and reports any that failed."""
+        with self._saves_lock:
+            pending, self._pending_saves = self._pending_saves, {}
+        wait(pending.values())
+        for item_id, future in pending.items():
+            if future.exception() is not None:
+                print(f"Failed to save scraped data for {item_id}: {future.exception()}")
+
+    def scrape_multiple(
+        self, item_ids: list[str], limit: int | None = None
+    ) -> tuple[list[dict], str | None]:
+        """
+        Scrapes multiple pages based on their unique IDs.
+        Stops on the first failed game, if any clues are skipped, or after reaching the limit.
+
+        Args:
+            item_ids (list[str]): List of unique identifiers.
+            limit (int, optional): Maximum number of items to scrape. Stops after this many successful scrapes.
+
+        Returns:
+            tuple[list[dict], str | None]: List of extracted data, and the reason scraping
+                stopped early (None if every selected item was scraped).
+        """
+        results = []
+        scraper = self.iter_scrape(item_ids, limit)
+        while True:
+            try:
+                results.append(next(scraper))
+            except StopIteration as stop:
+                return results, stop.value
+
+    def iter_scrape(
+        self, item_ids: list[str], limit: int | None = None
+    ) -> Generator[dict, None, str | None]:
+        """
+        Scrapes multiple pages like scrape_multiple, yielding each result in input order.
+        The consumer may stop early without tearing down the workers.
+
+        Args:
+            item_ids (list[str]): List of unique identifiers.
+            limit (int, optional): Maximum number of items to scrape. Stops after this many successful scrapes.
+
+        Returns:
+            str | None: As the generator's return value, the reason scraping stopped early.
+        """
+        item_ids, limited = self._select_ids(item_ids, limit)
+
+        saved = 0
+        try:
+            with self._scrape_session() as submit:
+                # Workers only load and parse, at most `workers` pages ahead; pages are
+                # saved here in input order, so once the run stops, pages loaded past
+                # the stopping one are dropped instead of committed unchecked
+                remaining = iter(item_ids)
+                ahead = deque(
+                    (item_id, submit(item_id)) for item_id in islice(remaining, self.workers)
+                )
+                while ahead:
+                    item_id, future = ahead.popleft()
+                    for next_id in islice(remaining, 1):
+                        ahead.append((next_id, submit(next_id)))
+
+                    result = self._record_page(item_id, future.result)
+                    save_error = None if result is None else self._wait_for_save(item_id)
+                    if result is not None and save_error is None:
+                        # The page is in storage, even if it stops the run below
+                        saved += 1
+
+                    stop_reason = self._stop_reason(item_id, result, save_error, saved)
+                    if stop_reason is not None:
+                        return stop_reason
+                    yield result
+        finally:
+            self._drain_saves()
+
+        if limited:
+            print(f"Reached limit of {limit} items. Stopping.")
+        return None
+
+    @contextmanager
+    def _scrape_session(self) -> Iterator[Callable[[str], Future]]:
+        """Yields a function that starts loading one page and returns a Future of its data."""
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            yield functools.partial(executor.submit, self._fetch_page)
+        finally:
+            # Drop queued pages on early exit; in-flight ones finish but are not saved
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _select_ids(
+        self, item_ids: list[str], limit: int | None
+    ) -> tuple[list[str], bool]:
+        """
+        Drops duplicate and already-processed IDs, then truncates to limit.
+        Returns the remaining IDs and whether they were cut by the limit.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must be at least 0, got {limit}")
+
+        unique_ids = list(dict.fromkeys(item_ids))
+        processed = self.storage.processed_set()
+        pending = [i for i in unique_ids if i not in processed]
+
+        skipped = len(unique_ids) - len(pending)
+        if skipped:
+            print(f"Skipping {skipped} already processed item(s)")
+
+        if limit is not None and len(pending) > limit:
+            # Any failure stops the run, so only the first `limit` IDs can succeed
+            return pending[:limit], True
+        return pending, False
+
+    def _stop_reason(
+        self,
+        item_id: str,
+        result: dict | None,
+        save_error: BaseException | None,
+        saved: int,
+    ) -> str | None:
+        """
+        Returns why a scrape result should stop the run, or None to continue.
+        `saved` counts the pages storage has accepted so far, including this one.
+        """
+        if result is None:
+            return (
+                f"Scraping stopped: failed to scrape game {item_id}. "
+                f"Progress saved for {saved} game(s)."
+            )
+
+        if save_error is not None:
+            return (
+                f"Scraping stopped: failed to save game {item_id}: {save_error}. "
+                f"Progress saved for {saved} game(s)."
+            )
+
+        # Check if the scrape was marked as failed
+        if result.get("_metadata", {}).get("scrape_failed", False):
+            return (
+                f"Scraping stopped: game {item_id} failed. "
+                f"Progress saved for {saved} game(s)."
+            )
+
+        # Check if any clues were skipped (individual clue parsing errors)
+        skipped_clues = result.get("skipped_clues", [])
+        if len(skipped_clues) > 0:
+            return (
+                f"Scraping stopped: game {item_id} had {len(skipped_clues)} skipped clue(s). "
+                f"Progress saved for {saved} game(s)."
+            )
+
+        return None
+
+    def close(self) -> None:
+        """Finishes pending saves and closes all pooled workers."""
+        self._drain_saves()
+        self._io_pool.shutdown()
+
+        for worker in self._workers:
+            self._close_worker(worker)
+        self._workers.clear()
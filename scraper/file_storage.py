@@ -1,13 +1,21 @@
+import atexit
+import codecs
+import gzip
 import os
-import json
-from typing import Any, Dict, Optional, Set
+import threading
+import orjson
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 
 class FileStorageManager:
     """Manages loading and saving scraped data using unique IDs."""
 
-    def __init__(self, data_dir: str = "data/scraped_data") -> None:
+    # Number of scraped items buffered in memory before they are written out
+    BATCH = 16
+
+    def __init__(self, data_dir: str = "data/scraped_data", pretty: bool = False) -> None:
         self.data_dir = data_dir
+        self.pretty = pretty
         os.makedirs(data_dir, exist_ok=True)
 
         self.processed_file = os.path.join(data_dir, "processed_ids.txt")
@@ -16,45 +24,153 @@ class FileStorageManager:
         self.processed_ids = self._load_ids(self.processed_file)
         self.errored_ids = self._load_ids(self.errored_file)
 
+        # Append-only logs: one line per ID, "-<id>" marks a removal
+        self._proc_fp = open(self.processed_file, "a", buffering=1)
+        self._err_fp = open(self.errored_file, "a", buffering=1)
+
+        # Serialized items and log lines waiting for the next flush
+        self._pending: List[Tuple[str, bytes]] = []
+        self._pending_proc: List[str] = []
+        self._pending_err: List[str] = []
+
+        # Guards the ID sets, buffers and log handles across scraper threads
+        self._lock = threading.RLock()
+
+        atexit.register(self.close)
+
     def _load_ids(self, path: str) -> Set[str]:
+        ids: Set[str] = set()
+        records = 0
         if os.path.exists(path):
             with open(path, "r") as f:
-                return set(line.strip() for line in f.readlines())
-        return set()
+                # Iterate the file lazily rather than materializing readlines()
+                for line in f:
+                    item_id = line.strip()
+                    if not item_id:
+                        continue
+                    records += 1
+                    if item_id.startswith("-"):
+                        ids.discard(item_id[1:])
+                    else:
+                        ids.add(item_id)
 
-    def _save_ids(self, path: str, ids: Set[str]) -> None:
-        with open(path, "w") as f:
-            for item_id in sorted(ids):
-                f.write(f"{item_id}\n")
+        # Rewrite the log once it is mostly tombstones and superseded entries
+        if records > 2 * len(ids) + self.BATCH:
+            self._compact_log(path, ids)
+        return ids
+
+    def _compact_log(self, path: str, ids: Set[str]) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write("".join(f"{item_id}\n" for item_id in ids))
+        os.replace(tmp_path, path)
+
+    def _filepath(self, item_id: str) -> str:
+        return os.path.join(self.data_dir, f"{item_id}.json")
 
     def is_processed(self, item_id: str) -> bool:
         return item_id in self.processed_ids
 
+    def processed_set(self) -> FrozenSet[str]:
+        """Returns a snapshot of all processed IDs for bulk filtering."""
+        with self._lock:
+            return frozenset(self.processed_ids)
+
     def save_data(self, item_id: str, data: Dict[str, Any]) -> str:
-        filepath = os.path.join(self.data_dir, f"{item_id}.json")
+        with self._lock:
+            filepath = self._filepath(item_id)
+            option = orjson.OPT_INDENT_2 if self.pretty else 0
+            self._pending.append((filepath, orjson.dumps(data, option=option)))
+
+            has_errors = bool(data.get("_metadata", {}).get("errors"))
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+            if has_errors:
+                if item_id not in self.errored_ids:
+                    self.errored_ids.add(item_id)
+                    self._pending_err.append(f"{item_id}\n")
+            else:
+                self.processed_ids.add(item_id)
+                self._pending_proc.append(f"{item_id}\n")
 
-        has_errors = bool(data.get("_metadata", {}).get("errors"))
+                # If it was previously errored, write a tombstone for it
+                if item_id in self.errored_ids:
+                    self.errored_ids.remove(item_id)
+                    self._pending_err.append(f"-{item_id}\n")
 
-        if has_errors:
-            self.errored_ids.add(item_id)
-            self._save_ids(self.errored_file, self.errored_ids)
-        else:
-            self.processed_ids.add(item_id)
-            self._save_ids(self.processed_file, self.processed_ids)
+            if len(self._pending) >= self.BATCH:
+                self.flush()
 
-            # If it was previously errored, remove it
-            if item_id in self.errored_ids:
-                self.errored_ids.remove(item_id)
-                self._save_ids(self.errored_file, self.errored_ids)
+            return filepath
 
-        return filepath
+    def flush(self) -> None:
+        """Writes all buffered items to disk, then appends their IDs to the logs."""
+        with self._lock:
+            # Write to a temp file and rename, so an interrupted write never
+            # leaves a truncated JSON file behind
+            for filepath, payload in self._pending:
+                tmp_path = f"{filepath}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, filepath)
+            self._pending.clear()
+
+            # ID logs are only updated once the data files they refer to exist
+            for fp, lines in (
+                (self._proc_fp, self._pending_proc),
+                (self._err_fp, self._pending_err),
+            ):
+                if lines:
+                    fp.write("".join(lines))
+                    os.fsync(fp.fileno())
+                    lines.clear()
 
     def get_data(self, item_id: str) -> Optional[Dict[str, Any]]:
-        filepath = os.path.join(self.data_dir, f"{item_id}.json")
+        if self._pending:
+            self.flush()
+
+        filepath = self._filepath(item_id)
         if os.path.exists(filepath):
-            with open(filepath, "r") as f:
-                return json.load(f)
+            with open(filepath, "rb") as f:
+                return orjson.loads(f.read())
+        return None
+
+    def _page_path(self, item_id: str) -> str:
+        return os.path.join(self.data_dir, "pages", f"{item_id}.html.gz")
+
+    def load_page(self, item_id: str) -> Optional[Union[str, bytes]]:
+        """
+        Returns the cached HTML of a page, or None if it was never cached. Pages cached
+        as text come back as str, pages cached as undecoded bytes come back as bytes.
+        """
+        page_path = self._page_path(item_id)
+        if os.path.exists(page_path):
+            with gzip.open(page_path, "rb") as f:
+                html = f.read()
+            if html.startswith(codecs.BOM_UTF8):
+                return html.decode("utf-8-sig")
+            return html
         return None
+
+    def save_page(self, item_id: str, html: Union[str, bytes]) -> None:
+        """Caches the HTML of a page, gzip-compressed."""
+        # Text is stored as UTF-8 behind a BOM, which marks it as already decoded;
+        # bytes are stored as fetched, for lxml to decode from the page's <meta charset>
+        if isinstance(html, str):
+            html = html.encode("utf-8-sig")
+
+        page_path = self._page_path(item_id)
+        os.makedirs(os.path.dirname(page_path), exist_ok=True)
+        tmp_path = f"{page_path}.tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(html)
+        os.replace(tmp_path, page_path)
+
+    def close(self) -> None:
+        """Flushes buffered items and closes the processed/errored ID logs."""
+        with self._lock:
+            if self._proc_fp.closed:
+                return
+            self.flush()
+            self._proc_fp.close()
+            self._err_fp.close()
+        atexit.unregister(self.close)
@@ -0,0 +1,78 @@
+import codecs
+import email.message
+import requests
+from scraper.base_scraper import BaseScraper
+
+
+def header_charset(content_type: str) -> str | None:
+    """Returns the charset declared in a Content-Type header value, if any."""
+    message = email.message.Message()
+    message["Content-Type"] = content_type
+    return message.get_content_charset()
+
+
+def decode_body(body: bytes, charset: str | None) -> str | bytes:
+    """
+    Decodes a response body with the charset its headers declared. Without a (known)
+    charset the raw bytes are returned, so lxml can honour the page's <meta charset>.
+    """
+    if charset:
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            return body
+        return body.decode(charset, errors="replace")
+    return body
+
+
+class HttpMixin:
+    """Request settings and the optional page cache shared by the HTTP-based scrapers."""
+
+    # Seconds to wait for a response before giving up on a page
+    REQUEST_TIMEOUT = 30
+
+    USER_AGENT = (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    )
+
+    def __init__(self, *args, cache_pages: bool = False, **kwargs) -> None:
+        """
+        Initializes the scraper; see BaseScraper for the shared arguments.
+
+        Args:
+            cache_pages (bool): Keep fetched HTML in storage and reuse it instead of refetching.
+        """
+        self.cache_pages = cache_pages
+        super().__init__(*args, **kwargs)
+
+
+class HttpScraper(HttpMixin, BaseScraper):
+    """A scraper that fetches static pages over HTTP and parses them with lxml, without a browser."""
+
+    def _create_worker(self, index: int):
+        """Creates an HTTP session and a parser that works on raw HTML."""
+        session = requests.Session()
+        session.headers.update({"User-Agent": self.USER_AGENT})
+        return session, self.parser_class()
+
+    def _close_worker(self, worker) -> None:
+        session, _ = worker
+        session.close()
+
+    def _load_and_parse(self, item_id: str, url: str) -> dict:
+        """Fetches a page with a pooled session, or from the page cache, and extracts its data."""
+        with self._borrow_worker() as (session, parser):
+            html = self.storage.load_page(item_id) if self.cache_pages else None
+            if html is None:
+                response = session.get(url, timeout=self.REQUEST_TIMEOUT)
+                response.raise_for_status()
+                # Not response.text: without a header charset, requests falls back to
+                # ISO-8859-1 for text/html instead of letting lxml read <meta charset>
+                html = decode_body(
+                    response.content,
+                    header_charset(response.headers.get("Content-Type", "")),
+                )
+                if self.cache_pages:
+                    self.storage.save_page(item_id, html)
+            return parser.parse_html(html)
@@ -1,2 +1,2 @@
-from .jeopardy_game import JeopardyGameParser
+from .jeopardy_game import Clue, JeopardyGameParser
 from .jeopardy_season_list import JeopardySeasonListParser
\ No newline at end of file
@@ -1,175 +1,207 @@
 import re
+from dataclasses import dataclass
+import lxml.html
+from lxml.html import HtmlElement
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import (
-    NoSuchElementException,
-    ElementClickInterceptedException,
-)
+
+
+_TITLE_RE = re.compile(r"Show #(\d+) - (.+)")
+_RESPONSE_RE = re.compile(r'<em class=\\?"correct_response\\?">(.*?)</em>', re.DOTALL)
+
+_MAIN_ROUNDS = {
+    "jeopardy_round": "SJ",
+    "double_jeopardy_round": "DJ",
+}
+
+# Board values per row for each main round
+_DOLLARS = {
+    "SJ": (200, 400, 600, 800, 1000),
+    "DJ": (400, 800, 1200, 1600, 2000),
+}
+_NO_DOLLARS = (None,) * 5
+
+
+@dataclass(slots=True)
+class Clue:
+    """A single clue; stored as a JSON object by FileStorageManager (via orjson)."""
+
+    category: str
+    clue_text: str
+    correct_response: str
+    round: str
+    is_daily_double: bool
+    dollar_val: int | None
+
+
+def _empty_game_data() -> dict:
+    return {
+        "game_id": None,
+        "game_date": None,
+        "clues": [],
+        "skipped_clues": [],
+        "_metadata": {"errors": []},
+    }
+
+
+def _parse_game_title(game_title: str) -> tuple[int | None, str | None]:
+    match = _TITLE_RE.search(game_title)
+    if match:
+        return int(match.group(1)), match.group(2).strip()
+    return None, None
+
+
+def _find_by_class(element: HtmlElement, class_name: str) -> list[HtmlElement]:
+    """Returns descendants of an lxml element carrying the given CSS class."""
+    return element.xpath(
+        f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+    )
+
+
+def _first_by_class(element: HtmlElement, class_name: str) -> HtmlElement:
+    """Returns the first descendant with the given CSS class, or raises ValueError."""
+    matches = _find_by_class(element, class_name)
+    if not matches:
+        raise ValueError(f"No element with class '{class_name}'")
+    return matches[0]
+
+
+def _text(element: HtmlElement) -> str:
+    """Returns an element's text with all whitespace, including <br> breaks, collapsed to single spaces."""
+    # text_content() drops <br> without a separator, which would glue the words around it
+    for br in element.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+    return " ".join(element.text_content().split())
 
 
 class JeopardyGameParser:
-    """Parses Jeopardy! game data from a Selenium-loaded page."""
+    """Parses Jeopardy! game data from a Selenium-loaded page or its static HTML."""
+
+    # Element whose presence means the page is ready to be parsed
+    READY_LOCATOR = (By.ID, "game_title")
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: WebDriver | None = None):
         self.driver = driver
 
     def parse(self) -> dict:
-        """Extracts structured data from a Jeopardy! game page."""
-        data = {
-            "game_id": None,
-            "game_date": None,
-            "clues": [],
-            "skipped_clues": [],
-            "_metadata": {"errors": []},
-        }
+        """Extracts structured data from the Jeopardy! game page loaded in the driver."""
+        # One WebDriver round-trip for the whole page; everything else is parsed locally
+        return self.parse_html(self.driver.page_source)
+
+    def parse_html(self, html: str | bytes) -> dict:
+        """Extracts structured data from the static HTML of a Jeopardy! game page."""
+        data = _empty_game_data()
 
         try:
-            data["game_id"], data["game_date"] = self._extract_game_metadata()
+            tree = lxml.html.fromstring(html)
+
+            title = tree.get_element_by_id("game_title", None)
+            if title is not None:
+                data["game_id"], data["game_date"] = _parse_game_title(_text(title))
             if data["game_id"] is None or data["game_date"] is None:
                 data["_metadata"]["errors"].append("Missing game metadata.")
 
-            for round_id, round_name in {
-                "jeopardy_round": "SJ",
-                "double_jeopardy_round": "DJ",
-            }.items():
-                self._extract_main_round_data(round_id, round_name, data)
+            for round_id, round_name in _MAIN_ROUNDS.items():
+                try:
+                    round_tree = tree.get_element_by_id(round_id)
+                    self._parse_main_round(round_tree, round_name, data)
+                except Exception as e:
+                    data["_metadata"]["errors"].append(
+                        f"Failed to extract round {round_name}: {e}"
+                    )
 
-            self._extract_final_round_data(data)
+            try:
+                final_tree = tree.get_element_by_id("final_jeopardy_round")
+                self._parse_final_round(final_tree, data)
+            except Exception as e:
+                data["_metadata"]["errors"].append(
+                    f"Failed to extract Final Jeopardy: {e}"
+                )
 
         except Exception as e:
             data["_metadata"]["errors"].append(f"Unhandled exception in parse: {e}")
 
         return data
 
-    def _extract_game_metadata(self) -> tuple[int | None, str | None]:
-        try:
-            game_title = self.driver.find_element(By.ID, "game_title").text
-            match = re.search(r"Show #(\d+) - (.+)", game_title)
-            if match:
-                return int(match.group(1)), match.group(2).strip()
-        except Exception:
-            pass
-        return None, None
-
-    def _extract_main_round_data(
-        self, round_id: str, round_name: str, data: dict
+    def _parse_main_round(
+        self, round_tree: HtmlElement, round_name: str, data: dict
     ) -> None:
-        try:
-            round_element = self.driver.find_element(By.ID, round_id)
-            categories = self._extract_categories(round_element)
-
-            clue_elements = round_element.find_elements(By.CLASS_NAME, "clue")
-            for clue_index, clue_element in enumerate(clue_elements):
-                try:
-                    clue_text = clue_element.find_element(
-                        By.CLASS_NAME, "clue_text"
-                    ).text.strip()
-                    is_daily_double = self._is_daily_double(clue_element)
-                    dollar_val = self._infer_dollar_value(clue_index, round_name)
-
-                    self._click_clue_value(clue_element)
-                    correct_response = self._extract_correct_response(clue_element)
-
-                    category_index = clue_index % len(categories)
-                    category = (
-                        categories[category_index]
-                        if category_index < len(categories)
-                        else "Unknown"
-                    )
+        categories = self._extract_categories(round_tree)
 
-                    data["clues"].append(
-                        {
-                            "category": category,
-                            "clue_text": clue_text,
-                            "correct_response": correct_response,
-                            "round": round_name,
-                            "is_daily_double": is_daily_double,
-                            "dollar_val": dollar_val,
-                        }
-                    )
+        for clue_index, clue in enumerate(_find_by_class(round_tree, "clue")):
+            try:
+                clue_text = _text(_first_by_class(clue, "clue_text"))
+                is_daily_double = self._is_daily_double(clue)
+                dollar_val = self._infer_dollar_value(clue_index, round_name)
+                correct_response = self._extract_correct_response(clue)
+
+                category_index = clue_index % len(categories)
+                category = (
+                    categories[category_index]
+                    if category_index < len(categories)
+                    else "Unknown"
+                )
 
-                except Exception as clue_error:
-                    data["skipped_clues"].append(
-                        {
-                            "round": round_name,
-                            "error": str(clue_error),
-                            "raw_html": clue_element.get_attribute("outerHTML"),
-                        }
+                data["clues"].append(
+                    Clue(
+                        category=category,
+                        clue_text=clue_text,
+                        correct_response=correct_response,
+                        round=round_name,
+                        is_daily_double=is_daily_double,
+                        dollar_val=dollar_val,
                     )
+                )
 
-        except Exception as e:
-            data["_metadata"]["errors"].append(
-                f"Failed to extract round {round_name}: {e}"
-            )
+            except Exception as clue_error:
+                data["skipped_clues"].append(
+                    {
+                        "round": round_name,
+                        "error": str(clue_error),
+                        "raw_html": lxml.html.tostring(clue, encoding="unicode"),
+                    }
+                )
 
-    def _extract_final_round_data(self, data: dict) -> None:
-        try:
-            final_round = self.driver.find_element(By.ID, "final_jeopardy_round")
-            category = final_round.find_element(
-                By.CLASS_NAME, "category_name"
-            ).text.strip()
-            clue_text = final_round.find_element(
-                By.CLASS_NAME, "clue_text"
-            ).text.strip()
-
-            category_row = final_round.find_element(By.TAG_NAME, "tr")
-            category_row.click()
-
-            correct_response = final_round.find_element(
-                By.CLASS_NAME, "correct_response"
-            ).text.strip()
-
-            data["clues"].append(
-                {
-                    "category": category,
-                    "clue_text": clue_text,
-                    "correct_response": correct_response,
-                    "round": "FJ",
-                    "is_daily_double": False,
-                    "dollar_val": None,
-                }
+    def _parse_final_round(self, final_tree: HtmlElement, data: dict) -> None:
+        category = _text(_first_by_class(final_tree, "category_name"))
+        clue_text = _text(_first_by_class(final_tree, "clue_text"))
+        correct_response = self._find_correct_response(final_tree)
+        if correct_response is None:
+            raise ValueError("No correct response for Final Jeopardy")
+
+        data["clues"].append(
+            Clue(
+                category=category,
+                clue_text=clue_text,
+                correct_response=correct_response,
+                round="FJ",
+                is_daily_double=False,
+                dollar_val=None,
             )
+        )
 
-        except Exception as e:
-            data["_metadata"]["errors"].append(f"Failed to extract Final Jeopardy: {e}")
+    def _extract_categories(self, round_tree: HtmlElement) -> list[str]:
+        return [_text(cat) for cat in _find_by_class(round_tree, "category_name")]
 
-    def _extract_categories(self, round_element) -> list[str]:
-        return [
-            cat.text.strip()
-            for cat in round_element.find_elements(By.CLASS_NAME, "category_name")
-        ]
+    def _is_daily_double(self, clue: HtmlElement) -> bool:
+        return bool(_find_by_class(clue, "clue_value_daily_double"))
 
-    def _is_daily_double(self, clue_element) -> bool:
-        try:
-            clue_element.find_element(By.CLASS_NAME, "clue_value_daily_double")
-            return True
-        except NoSuchElementException:
-            return False
+    def _extract_correct_response(self, clue: HtmlElement) -> str:
+        correct_response = self._find_correct_response(clue)
+        return "[Unknown]" if correct_response is None else correct_response
 
-    def _click_clue_value(self, clue_element) -> None:
-        try:
-            try:
-                value_element = clue_element.find_element(By.CLASS_NAME, "clue_value")
-            except NoSuchElementException:
-                value_element = clue_element.find_element(
-                    By.CLASS_NAME, "clue_value_daily_double"
-                )
-            value_element.click()
-        except (NoSuchElementException, ElementClickInterceptedException):
-            pass
+    def _find_correct_response(self, element: HtmlElement) -> str | None:
+        responses = _find_by_class(element, "correct_response")
+        if responses:
+            return _text(responses[0])
 
-    def _extract_correct_response(self, clue_element) -> str:
-        try:
-            return clue_element.find_element(
-                By.CLASS_NAME, "correct_response"
-            ).text.strip()
-        except NoSuchElementException:
-            return "[Unknown]"
-
-    def _infer_dollar_value(self, clue_index: int, round_name: str) -> int:
-        row = clue_index // 6
-        if round_name == "SJ":
-            return [200, 400, 600, 800, 1000][row]
-        elif round_name == "DJ":
-            return [400, 800, 1200, 1600, 2000][row]
+        # Older pages embed the response in the toggle() handler instead of the DOM
+        for handler in element.xpath(".//@onmouseover"):
+            match = _RESPONSE_RE.search(handler)
+            if match:
+                fragment = match.group(1).replace("\\'", "'")
+                return _text(lxml.html.fragment_fromstring(fragment, create_parent="span"))
         return None
+
+    def _infer_dollar_value(self, clue_index: int, round_name: str) -> int | None:
+        return _DOLLARS.get(round_name, _NO_DOLLARS)[clue_index // 6]
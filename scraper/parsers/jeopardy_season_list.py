@@ -1,3 +1,4 @@
+import lxml.html
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 
@@ -5,33 +6,29 @@ from selenium.webdriver.common.by import By
 class JeopardySeasonListParser:
     """Placeholder parser for Jeopardy season list. Implementation coming soon."""
 
-    def __init__(self, driver: WebDriver):
+    # Element whose presence means the page is ready to be parsed
+    READY_LOCATOR = (By.ID, "content")
+
+    def __init__(self, driver: WebDriver | None = None):
         self.driver = driver
 
     def parse(self) -> dict:
-        """Extracts structured data from a Jeopardy! season list page."""
+        """Extracts structured data from the season list page loaded in the driver."""
+        return self.parse_html(self.driver.page_source)
+
+    def parse_html(self, html: str | bytes) -> dict:
+        """Extracts structured data from the static HTML of a season list page."""
         data = {"game_ids": []}
 
         try:
-            data["game_ids"] = self._extract_game_ids()
+            content = lxml.html.fromstring(html).get_element_by_id("content")
+            game_table = content.xpath(".//table")[0]
+            data["game_ids"] = [
+                int(row.xpath(".//a/@href")[0].split("?game_id=")[-1])
+                for row in game_table.xpath(".//tr")
+            ]
 
         except Exception as e:
             print(f"Failed to extract season list data: {e}")
 
         return data
-
-    def _extract_game_ids(self) -> list[int]:
-        content_element = self.driver.find_element(By.ID, "content")
-        game_table_element = content_element.find_element(By.TAG_NAME, "table")
-        game_row_elements = game_table_element.find_elements(By.TAG_NAME, "tr")
-        game_links = [
-            row_element.find_element(By.TAG_NAME, "a")
-            for row_element in game_row_elements
-        ]
-
-        game_ids = [
-            int(link.get_attribute("href").split("?game_id=")[-1])
-            for link in game_links
-        ]
-
-        return game_ids
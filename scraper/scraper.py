@@ -1,209 +1,204 @@
-import time
 import config
+import functools
 import os
-from datetime import datetime
+import shutil
+import tempfile
 from pathlib import Path
 from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
-from scraper.parsers import JeopardyGameParser, JeopardySeasonListParser
+from scraper.base_scraper import BaseScraper
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_chromedriver_path() -> str:
+    """Returns the ChromeDriver executable path, resolving it at most once per process."""
+    # Reuse the driver path resolved by an earlier run when it is still valid,
+    # so startup needs neither ChromeDriverManager's network check nor internet
+    driver_cache = _chromedriver_cache_file()
+    driver_path = driver_cache.read_text().strip() if driver_cache.exists() else ""
+    if not driver_path or not os.path.isfile(driver_path):
+        driver_path = _install_chromedriver()
+        driver_cache.parent.mkdir(parents=True, exist_ok=True)
+        driver_cache.write_text(driver_path)
+    return driver_path
+
+
+def _chromedriver_cache_file() -> Path:
+    return Path(config.DATA_DIR) / ".chromedriver_path"
+
+
+def _forget_chromedriver_path() -> None:
+    """Drops the cached ChromeDriver path so the next resolution reinstalls it."""
+    _chromedriver_cache_file().unlink(missing_ok=True)
+    _resolve_chromedriver_path.cache_clear()
+
+
+def _is_chromedriver(path: Path) -> bool:
+    return (
+        path.is_file()
+        and path.name == "chromedriver"
+        and "THIRD_PARTY" not in str(path)
+        and "LICENSE" not in str(path)
+    )
+
+
+def _install_chromedriver() -> str:
+    """Installs ChromeDriver if needed and returns the path to its executable."""
+    driver_path = Path(ChromeDriverManager().install())
+
+    # ChromeDriverManager sometimes returns the wrong file (e.g., THIRD_PARTY_NOTICES.chromedriver),
+    # so look for the actual executable next to it, then in nested folders
+    if not _is_chromedriver(driver_path):
+        driver_dir = driver_path.parent
+        actual_chromedriver = driver_dir / "chromedriver"
+        if actual_chromedriver.is_file():
+            driver_path = actual_chromedriver
+        else:
+            driver_path = next(
+                (p for p in driver_dir.rglob("chromedriver") if _is_chromedriver(p)),
+                driver_path,
+            )
 
+    # Ensure the chromedriver is executable, without a chmod when it already is
+    if driver_path.exists() and not driver_path.stat().st_mode & 0o111:
+        os.chmod(driver_path, 0o755)
 
-class WebScraper:
-    """A web scraper that uses Selenium to extract data and stores it using FileStorageManager."""
+    return str(driver_path)
 
-    SUPPORTED_PARSERS = {
-        "jeopardy_game": JeopardyGameParser,
-        "jeopardy_season_list": JeopardySeasonListParser,
-    }
-
-    def __init__(
-        self, storage_manager, parser: str, url_prefix: str = config.URL_PREFIX
-    ) -> None:
-        """
-        Initializes the scraper with a storage manager, parser type, and URL prefix.
-
-        Args:
-            storage_manager: The storage manager responsible for saving and loading data.
-            parser (str): The name of the parser to use.
-            url_prefix (str): The common URL prefix to reconstruct full URLs from IDs.
-        """
-        if parser not in self.SUPPORTED_PARSERS:
-            raise ValueError(
-                f"Unsupported parser '{parser}'. Supported values: {list(self.SUPPORTED_PARSERS.keys())}"
-            )
 
-        self._setup_driver()
+def _profile_in_use(profile_dir: Path) -> bool:
+    """Returns whether a running Chrome holds the singleton lock of a profile directory."""
+    lock = profile_dir / "SingletonLock"
+    if not lock.is_symlink():
+        return False
+
+    # The lock points at "<hostname>-<pid>" of its owner; Chrome takes over locks of dead processes
+    try:
+        os.kill(int(os.readlink(lock).rpartition("-")[2]), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        pass
+    return True
 
-        self.storage = storage_manager
-        self.url_prefix = url_prefix
-        self.parser = self.SUPPORTED_PARSERS[parser](
-            self.driver
-        )  # Dynamically instantiate parser
 
-    def _setup_driver(self) -> None:
-        """Configures and initializes the Chrome WebDriver."""
+class WebScraper(BaseScraper):
+    """A web scraper that uses Selenium to extract data and stores it using FileStorageManager."""
+
+    # Seconds to wait for the parser's READY_LOCATOR element after loading a page,
+    # and how often to check for it
+    READY_TIMEOUT = 10
+    READY_POLL_FREQUENCY = 0.25
+
+    # Root of the per-parser, per-worker Chrome profiles and the size of each one's disk cache
+    PROFILE_DIR = Path.home() / ".cache" / "j-scraper" / "profile"
+    DISK_CACHE_SIZE = 256 * 1024 * 1024
+
+    # Static assets and third-party ad/analytics requests blocked at the network layer
+    BLOCKED_URLS = [
+        "*.png",
+        "*.jpg",
+        "*.gif",
+        "*.css",
+        "*.woff*",
+        "*doubleclick.net*",
+        "*google-analytics*",
+        "*googletagmanager*",
+        "*googlesyndication*",
+    ]
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initializes the scraper and one WebDriver per worker; see BaseScraper for the arguments."""
+        # Throwaway profiles used when another run holds the persistent one
+        self._temp_profiles: list[Path] = []
+        super().__init__(*args, **kwargs)
+
+    def _create_worker(self, index: int):
+        """Creates a WebDriver and a parser bound to it."""
+        driver = self._setup_driver(index)
+        return driver, self.parser_class(driver)
+
+    def _close_worker(self, worker) -> None:
+        driver, _ = worker
+        driver.quit()
+
+    def _setup_driver(self, index: int = 0) -> webdriver.Chrome:
+        """Configures and initializes a Chrome WebDriver with the index-th persistent profile."""
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
-
-        # Get the path from ChromeDriverManager and ensure we use the actual chromedriver executable
-        driver_path = ChromeDriverManager().install()
-        
-        # Fix: ChromeDriverManager sometimes returns the wrong file (e.g., THIRD_PARTY_NOTICES.chromedriver)
-        # We need to find the actual chromedriver executable
-        driver_path_obj = Path(driver_path)
-        
-        # If the returned path doesn't point to the actual chromedriver executable
-        if not driver_path_obj.name == 'chromedriver' or 'THIRD_PARTY' in driver_path or 'LICENSE' in driver_path:
-            # Look for chromedriver in the same directory
-            driver_dir = driver_path_obj.parent
-            actual_chromedriver = driver_dir / 'chromedriver'
-            
-            if actual_chromedriver.exists() and actual_chromedriver.is_file():
-                driver_path = str(actual_chromedriver)
-            else:
-                # Search in subdirectories (sometimes it's in a nested folder)
-                for potential_driver in driver_dir.rglob('chromedriver'):
-                    if (potential_driver.is_file() and 
-                        potential_driver.name == 'chromedriver' and
-                        'THIRD_PARTY' not in str(potential_driver) and
-                        'LICENSE' not in str(potential_driver)):
-                        # Ensure it's executable
-                        os.chmod(potential_driver, 0o755)
-                        driver_path = str(potential_driver)
-                        break
-        
-        # Ensure the chromedriver is executable
-        if os.path.exists(driver_path):
-            os.chmod(driver_path, 0o755)
-
-        self.driver = webdriver.Chrome(
-            service=Service(driver_path), options=chrome_options
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-gpu")
+
+        chrome_options.add_argument(f"--user-data-dir={self._profile_dir(index)}")
+        chrome_options.add_argument(f"--disk-cache-size={self.DISK_CACHE_SIZE}")
+
+        # Parsers only read the DOM, so skip images, stylesheets and fonts and
+        # let driver.get() return on DOMContentLoaded instead of the full load
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+            },
         )
-
-    def scrape_page(self, item_id: str) -> dict | None:
-        """
-        Scrapes a webpage based on its unique ID.
-
-        Args:
-            item_id (str): The unique identifier for the page.
-
-        Returns:
-            dict | None: Extracted data if successful, otherwise None.
-        """
-        if self.storage.is_processed(item_id):
-            print(f"Skipping {item_id} - already processed")
-            return None
-
-        url = f"{self.url_prefix}{item_id}"
+        chrome_options.page_load_strategy = "eager"
 
         try:
-            print(f"Scraping {url}")
-            self.driver.get(url)
-
-            # Delay to ensure the page loads
-            time.sleep(2)
-
-            # Extract data using parser
-            data = self.parser.parse()
-
-            # Add metadata
-            existing_metadata = data.get("_metadata", {})
-            data["_metadata"] = {
-                **existing_metadata,
-                "id": item_id,
-                "url": url,
-                "timestamp": datetime.now().isoformat(),
-            }
-
-            # Save the data (even if it has errors - partial data is better than nothing)
-            self.storage.save_data(item_id, data)
-
-            # Check if there were any errors
-            errors = existing_metadata.get("errors", [])
-            if errors:
-                print(f"Scraped {item_id} with {len(errors)} error(s) - check metadata")
-            else:
-                print(f"Successfully scraped {item_id}")
-            
-            return data
-
-        except Exception as e:
-            # Save partial data with error information even if parsing completely fails
-            error_message = f"Fatal error during scraping: {str(e)}"
-            print(f"Error scraping {item_id}: {error_message}")
-            
-            # Create minimal data structure with error metadata
-            error_data = {
-                "_metadata": {
-                    "errors": [error_message],
-                    "id": item_id,
-                    "url": url,
-                    "timestamp": datetime.now().isoformat(),
-                    "scrape_failed": True,
-                }
-            }
-            
-            # Try to save the error data
-            try:
-                self.storage.save_data(item_id, error_data)
-                print(f"Saved error metadata for {item_id}")
-            except Exception as save_error:
-                print(f"Failed to save error metadata for {item_id}: {save_error}")
-            
-            return None
-
-    def scrape_multiple(self, item_ids: list[str], limit: int | None = None) -> list[dict]:
-        """
-        Scrapes multiple pages based on their unique IDs.
-        Stops on the first failed game, if any clues are skipped, or after reaching the limit.
-
-        Args:
-            item_ids (list[str]): List of unique identifiers.
-            limit (int, optional): Maximum number of items to scrape. Stops after this many successful scrapes.
-
-        Returns:
-            list[dict]: List of extracted data.
-
-        Raises:
-            RuntimeError: If a game fails to scrape, has skipped clues, or other errors (stops iteration).
-        """
-        results = []
-        for item_id in item_ids:
-            # Check if we've reached the limit
-            if limit is not None and len(results) >= limit:
-                print(f"Reached limit of {limit} items. Stopping.")
-                break
-            
-            result = self.scrape_page(item_id)
-            if result is None:
-                raise RuntimeError(
-                    f"Scraping stopped: failed to scrape game {item_id}. "
-                    f"Progress saved for {len(results)} game(s)."
-                )
-            
-            # Check if the scrape was marked as failed
-            if result.get("_metadata", {}).get("scrape_failed", False):
-                raise RuntimeError(
-                    f"Scraping stopped: game {item_id} failed. "
-                    f"Progress saved for {len(results)} game(s)."
-                )
-            
-            # Check if any clues were skipped (individual clue parsing errors)
-            skipped_clues = result.get("skipped_clues", [])
-            if len(skipped_clues) > 0:
-                raise RuntimeError(
-                    f"Scraping stopped: game {item_id} had {len(skipped_clues)} skipped clue(s). "
-                    f"Progress saved for {len(results)} game(s)."
-                )
-            
-            results.append(result)
-        return results
+            driver = webdriver.Chrome(
+                service=Service(_resolve_chromedriver_path()), options=chrome_options
+            )
+        except SessionNotCreatedException:
+            # The cached driver still exists but may no longer match Chrome after it
+            # auto-updated; resolve a fresh one and retry once
+            _forget_chromedriver_path()
+            driver = webdriver.Chrome(
+                service=Service(_resolve_chromedriver_path()), options=chrome_options
+            )
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URLS})
+        return driver
+
+    def _profile_dir(self, index: int) -> Path:
+        """Returns the index-th persistent Chrome profile, or a temporary one if it is in use."""
+        # A persistent profile keeps Chrome's HTTP cache across runs. Chrome locks a
+        # profile to one process, so every pooled driver of every parser gets its own
+        # directory, and a concurrent run with the same parser falls back to a fresh one
+        profile_dir = self.PROFILE_DIR / self.parser_name / f"worker-{index}"
+        if _profile_in_use(profile_dir):
+            profile_dir = Path(tempfile.mkdtemp(prefix="j-scraper-profile-"))
+            self._temp_profiles.append(profile_dir)
+        else:
+            profile_dir.mkdir(parents=True, exist_ok=True)
+        return profile_dir
+
+    def _load_and_parse(self, item_id: str, url: str) -> dict:
+        """Loads a page in a pooled WebDriver and extracts its data."""
+        with self._borrow_worker() as (driver, parser):
+            driver.get(url)
+
+            # Wait until the element the parser depends on is present
+            WebDriverWait(
+                driver, self.READY_TIMEOUT, poll_frequency=self.READY_POLL_FREQUENCY
+            ).until(
+                EC.presence_of_element_located(parser.READY_LOCATOR)
+            )
+
+            return parser.parse()
 
     def close(self) -> None:
-        """Closes the Selenium WebDriver."""
-        if hasattr(self, "driver"):
-            self.driver.quit()
+        """Finishes pending saves and closes all pooled Selenium WebDrivers."""
+        super().close()
+
+        for profile_dir in self._temp_profiles:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        self._temp_profiles.clear()